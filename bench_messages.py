@@ -0,0 +1,138 @@
+"""Micro-benchmark: reply rendering before and after the messages module.
+
+Run with ``python bench_messages.py [players]``. It only needs the standard
+library, so it runs without bot tokens or the Telegram/Gemini packages.
+
+Each reply is timed in several variants, relative to the legacy code:
+
+- render only: building the text from an already ranked top 10
+- cached: the same render when an identical board was already rendered
+- full request: ranking the players plus rendering (legacy sorts every
+  player; current slices the incrementally maintained Board)
+"""
+import sys
+import random
+import timeit
+
+import messages
+from standings import Board
+
+# The hint reply as a str.format template, for comparison with f-strings
+HINT_TEMPLATE = (
+    "👤 {username} used hint {hint_number}/{max_hints}\n"
+    "📝 Hint: {hint}\n"
+    "📊 Progress: {revealed}/{total} letters revealed\n"
+    "{point_message}\n"
+    "⚠️ Warning: If max hints are used, all players will be penalized!"
+).format
+
+
+def legacy_sorted_top(points):
+    return sorted(points.items(), key=lambda x: x[1], reverse=True)[:10]
+
+
+def legacy_render_leaderboard(top, users):
+    # The old /leaderboard string concatenation
+    leaderboard = "🏆 Leaderboard 🏆\n\n"
+    for i, (user_id, score) in enumerate(top, 1):
+        username = users.get(user_id, {}).get('username', 'Anonymous')
+        leaderboard += f"{i}. {username}: {score} points\n"
+    return leaderboard
+
+
+def legacy_render_final_results(top, users):
+    # The old game-over message with if/elif medals
+    winners_msg = "🎮 Game Over! Final Results 🏁\n\n"
+    winners_msg += "🏆 Top Players 🏆\n\n"
+    for i, (user_id, score) in enumerate(top, 1):
+        username = users.get(user_id, {}).get('username', 'Anonymous')
+        if i == 1:
+            medal = "🥇"
+        elif i == 2:
+            medal = "🥈"
+        elif i == 3:
+            medal = "🥉"
+        else:
+            medal = "👏"
+        winners_msg += f"{medal} {i}. {username}: {score} points\n"
+    winners_msg += "\n🌟 Thanks for playing! 🌟\n"
+    winners_msg += "See you in the next game! 👋"
+    return winners_msg
+
+
+def legacy_hint(username, hint, used, max_hints, revealed, total, point_message):
+    return (
+        f"👤 {username} used hint {used}/{max_hints}\n"
+        f"📝 Hint: {hint}\n"
+        f"📊 Progress: {revealed}/{total} letters revealed\n"
+        f"{point_message}\n"
+        f"⚠️ Warning: If max hints are used, all players will be penalized!"
+    )
+
+
+def rows(top, users):
+    return tuple((users.get(user_id, {}).get('username', 'Anonymous'), score) for user_id, score in top)
+
+
+def report(name, variants, number):
+    """Print one line per (label, callable); the first variant is the baseline"""
+    baseline = None
+    for label, func in variants:
+        micros = min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+        baseline = baseline or micros
+        print(f"{name:<15}{label:<26}{micros:>10.2f}{baseline / micros:>9.1f}x")
+        name = ""
+
+
+def main():
+    player_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    random.seed(311)
+    users = {str(i): {'username': f"player{i}"} for i in range(player_count)}
+    # Distinct scores so both orderings agree (ties are ranked differently)
+    scores = random.sample(range(player_count * 10), player_count)
+    points = dict(zip(users, scores))
+    board = Board(points)
+
+    top = legacy_sorted_top(points)
+    top_rows = rows(top, users)
+    render_leaderboard = messages.render_leaderboard.__wrapped__
+    render_final_results = messages.render_final_results.__wrapped__
+
+    assert legacy_render_leaderboard(top, users).split("\n", 1)[1] == \
+        render_leaderboard("Leaderboard", top_rows).split("\n", 1)[1]
+    assert legacy_render_final_results(top, users) == render_final_results(top_rows)
+    assert board.top(10) == top
+
+    print(f"{player_count} players, microseconds per reply")
+    print(f"{'reply':<15}{'variant':<26}{'micros':>10}{'vs legacy':>10}")
+    report("leaderboard", [
+        ("legacy render", lambda: legacy_render_leaderboard(top, users)),
+        ("current render (uncached)", lambda: render_leaderboard("Leaderboard", rows(top, users))),
+        ("current render (cached)", lambda: messages.render_leaderboard("Leaderboard", rows(top, users))),
+    ], number=20000)
+    report("final results", [
+        ("legacy render", lambda: legacy_render_final_results(top, users)),
+        ("current render (uncached)", lambda: render_final_results(rows(top, users))),
+        ("current render (cached)", lambda: messages.render_final_results(rows(top, users))),
+    ], number=20000)
+    report("leaderboard", [
+        ("legacy full request", lambda: legacy_render_leaderboard(legacy_sorted_top(points), users)),
+        ("current full request", lambda: messages.render_leaderboard("Leaderboard", rows(board.top(10), users))),
+    ], number=200)
+
+    hint_args = {
+        'username': "player1", 'hint_number': 2, 'max_hints': 3, 'hint': "k?l?g",
+        'revealed': 3, 'total': 5, 'point_message': "📉 -2 points (now at 4 points)",
+    }
+    legacy_args = tuple(hint_args[key] for key in
+                        ('username', 'hint', 'hint_number', 'max_hints', 'revealed', 'total', 'point_message'))
+    assert legacy_hint(*legacy_args) == HINT_TEMPLATE(**hint_args) == messages.hint_message(**hint_args)
+    report("hint", [
+        ("legacy inline f-string", lambda: legacy_hint(*legacy_args)),
+        ("str.format template", lambda: HINT_TEMPLATE(**hint_args)),
+        ("current f-string function", lambda: messages.hint_message(**hint_args)),
+    ], number=50000)
+
+
+if __name__ == "__main__":
+    main()
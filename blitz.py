@@ -0,0 +1,75 @@
+import time
+from collections import Counter
+
+# Points for each word a player solves, plus a bonus for being first on it
+WORD_POINTS = 1
+FIRST_SOLVER_BONUS = 2
+
+
+class BlitzRound:
+    """A batch of scrambled words that everyone answers at the same time.
+
+    Guesses are matched against the whole batch with a single dict lookup
+    and only recorded; nobody is scored until ``scores()`` is called once at
+    the end of the round, so a burst of guesses never touches storage.
+    """
+
+    def __init__(self, pairs, duration, chat_id=None):
+        self.words = [word for word, _ in pairs]
+        self.scrambled = [scrambled for _, scrambled in pairs]
+        self.duration = duration
+        self.chat_id = chat_id
+        self.started_at = time.time()
+        self._lookup = {word: i for i, word in enumerate(self.words)}
+        self.solvers = {}        # word -> user ids in the order they solved it
+        self.solve_seconds = {}  # word -> seconds until the first solve
+        self._credited = set()   # (user_id, word) pairs already recorded
+
+    def remaining(self):
+        """Seconds left before the round ends (never negative)"""
+        return max(0.0, self.started_at + self.duration - time.time())
+
+    def to_state(self):
+        """JSON-friendly snapshot for checkpoints"""
+        return {
+            'pairs': [[word, scrambled] for word, scrambled in zip(self.words, self.scrambled)],
+            'duration': self.duration,
+            'chat_id': self.chat_id,
+            'started_at': self.started_at,
+            'solvers': self.solvers,
+            'solve_seconds': self.solve_seconds,
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        blitz = cls(state['pairs'], state['duration'], state.get('chat_id'))
+        blitz.started_at = state['started_at']
+        blitz.solvers = state.get('solvers', {})
+        blitz.solve_seconds = state.get('solve_seconds', {})
+        blitz._credited = {(user_id, word) for word, solvers in blitz.solvers.items() for user_id in solvers}
+        return blitz
+
+    def matches(self, text):
+        """Check if a message is one of the batch's answers"""
+        return text.lower().strip() in self._lookup
+
+    def guess(self, user_id, text):
+        """Record a guess; returns True if it solved a word for this player"""
+        word = text.lower().strip()
+        if word not in self._lookup or (user_id, word) in self._credited:
+            return False
+        self._credited.add((user_id, word))
+        if word not in self.solvers:
+            self.solvers[word] = []
+            self.solve_seconds[word] = time.time() - self.started_at
+        self.solvers[word].append(user_id)
+        return True
+
+    def scores(self):
+        """Points earned by every participant, computed in one pass"""
+        totals = Counter()
+        for solvers in self.solvers.values():
+            for user_id in solvers:
+                totals[user_id] += WORD_POINTS
+            totals[solvers[0]] += FIRST_SOLVER_BONUS
+        return totals
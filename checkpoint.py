@@ -0,0 +1,55 @@
+import os
+import json
+import zlib
+import asyncio
+import hashlib
+
+
+class Checkpointer:
+    """Saves compressed snapshots of in-memory game state for restarts.
+
+    Snapshots are zlib-compressed JSON written atomically. A snapshot
+    identical to the last one written is skipped, so the periodic loop costs
+    one serialization and no disk I/O while nothing changes.
+    """
+
+    def __init__(self, path, interval=15.0):
+        self.path = path
+        self.interval = interval
+        self._last_digest = None
+
+    def save(self, state):
+        """Write ``state`` if it changed since the last save; returns True if written"""
+        try:
+            raw = json.dumps(state, separators=(',', ':'), sort_keys=True).encode('utf-8')
+            digest = hashlib.blake2b(raw, digest_size=16).digest()
+            if digest == self._last_digest:
+                return False
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(zlib.compress(raw, 6))
+            os.replace(tmp_path, self.path)
+            self._last_digest = digest
+            return True
+        except Exception as e:
+            print(f"Error saving checkpoint: {str(e)}")
+            return False
+
+    def load(self):
+        """Return the last saved state, or None if there is none usable"""
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, 'rb') as f:
+                raw = zlib.decompress(f.read())
+            self._last_digest = hashlib.blake2b(raw, digest_size=16).digest()
+            return json.loads(raw)
+        except Exception as e:
+            print(f"Error loading checkpoint: {str(e)}")
+            return None
+
+    async def run(self, get_state):
+        """Save ``get_state()`` every ``interval`` seconds until cancelled"""
+        while True:
+            await asyncio.sleep(self.interval)
+            self.save(get_state())
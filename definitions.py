@@ -0,0 +1,93 @@
+import time
+import asyncio
+
+DEFINITION_PROMPT = 'very short answer anung ibig sabihin ng "{word}" and taglish funny hugot bad jokes 1 qoute word "{word}".'
+FALLBACK_DEFINITION = "📚 Walang definition ngayon, busy si AI... pero tama ka pa rin! 😅"
+
+
+class DefinitionService:
+    """Fetches word definitions from a Gemini-style model without flooding it.
+
+    - at most ``max_concurrency`` requests are sent at once
+    - concurrent requests for the same word share one in-flight call
+    - each call is bounded by ``timeout`` seconds
+    - after ``failure_threshold`` consecutive errors the circuit opens and
+      the fallback text is returned for ``cooldown`` seconds without calling
+      the model; the first call after the cooldown decides whether it closes
+
+    ``model`` only needs ``generate_content_async(prompt)`` or a blocking
+    ``generate_content(prompt)`` returning an object with a ``text`` field,
+    so a local fake can stand in for the real API.
+    """
+
+    def __init__(self, model, max_concurrency=4, timeout=10.0,
+                 failure_threshold=5, cooldown=60.0, fallback=FALLBACK_DEFINITION):
+        self.model = model
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.fallback = fallback
+        self._semaphore = None  # created lazily inside the running loop
+        self._in_flight = {}
+        self._failures = 0
+        self._open_until = 0.0
+
+    @property
+    def circuit_open(self):
+        return time.monotonic() < self._open_until
+
+    async def define(self, word):
+        """Return a formatted definition for ``word``, or the fallback text"""
+        if self.circuit_open:
+            return self.fallback
+
+        task = self._in_flight.get(word)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(word))
+            self._in_flight[word] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(word, None))
+
+        # Shield so one cancelled caller does not cancel the shared request
+        return await asyncio.shield(task)
+
+    async def _fetch(self, word):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with self._semaphore:
+            # The circuit may have opened while this request was queued
+            if self.circuit_open:
+                return self.fallback
+            try:
+                response = await asyncio.wait_for(
+                    self._generate(DEFINITION_PROMPT.format(word=word)), self.timeout
+                )
+                definition = response.text.strip() if response and response.text else ""
+            except asyncio.TimeoutError:
+                print(f"Error getting definition: timed out after {self.timeout}s")
+                self._record_failure()
+                return self.fallback
+            except Exception as e:
+                print(f"Error getting definition: {str(e)}")
+                self._record_failure()
+                return self.fallback
+
+        self._failures = 0
+        if not definition:
+            return self.fallback
+        if definition.startswith("Definition: "):
+            definition = definition[len("Definition: "):]
+        return f"📚 {definition}"
+
+    async def _generate(self, prompt):
+        if hasattr(self.model, 'generate_content_async'):
+            return await self.model.generate_content_async(prompt)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.model.generate_content, prompt)
+
+    def _record_failure(self):
+        self._failures += 1
+        if self._failures >= self.failure_threshold:
+            self._open_until = time.monotonic() + self.cooldown
+            print(f"Definition service paused for {self.cooldown}s after {self._failures} errors")
@@ -0,0 +1,170 @@
+from functools import lru_cache
+
+# Static texts, built once at import and sent as-is
+
+GAME_INFO = """
+🎮 WORD SCRAMBLE BATTLE 🎮
+
+📜 Description:
+A fun word guessing game where players compete to unscramble words while using strategy with hints and attacks! Battle your way to the top of the leaderboard!
+
+🎯 Game Features:
+• Random scrambled words (4-15 letters)
+• Automatic new words every 60 seconds
+• Points system with leaderboard
+• Hint system with strategy
+• Attack power to block opponents
+• Tagalog definition and hugot quotes
+• Continuous gameplay until stopped
+
+📋 Basic Rules:
+1. Join game: /joinscramble
+2. Guess the scrambled word by typing it
+3. First correct answer gets points (1-3 points)
+4. New word appears every 60 seconds
+5. Check rankings: /leaderboard [week|season|all]
+6. Past winners: /seasons
+
+💡 Hint System:
+• Use /hint to reveal letters
+• Max hints depends on word length
+• Each hint costs 1 point
+• Progressive reveals (more letters shown with each hint)
+• Players with 0 points limited to 3 hints
+• Points deducted increase with each hint used
+
+⚔️ Attack Power:
+• Use /attack username to block opponent
+• Costs 3 points to use attack
+• Can only use once per game session
+• Blocked player gets no points for correct answer
+• Attack power resets when new game starts
+
+🎁 Scoring System:
+• Correct answer: +1 to 3 points
+• Using hint: -1 point (increases with each hint)
+• Using attack: -3 points
+• Getting blocked: 0 points for correct answer
+
+👑 Admin Commands:
+• /start_game - Start new game
+• /stop_game - End game (or blitz) and show winners
+• /resetpoints - End the season (top 10 saved) and reset all scores
+• /reload_words - Reload word list
+• /blitz - Start a timed multi-word round
+
+💭 Winner Rewards:
+• Top players shown on leaderboard
+• Special medals for top 3 players (🥇🥈🥉)
+• Bragging rights until next game!
+
+Type /startscramblewords to begin! Good luck! 🎯
+"""
+
+RULES = """
+🎮 Welcome to Scramble Words! 🎮
+
+Rules:
+1. Words are 4-15 letters long
+2. Type /joinscramble to register
+3. Use /hint for help (max 3 hints, -1 point penalty)
+4. Check scores with /leaderboard [week|season|all]
+5. See past winners with /seasons
+6. Game continues automatically every 60 seconds
+
+Admin Commands:
+• /start_game - Start new game
+• /stop_game - Stop game or blitz
+• /resetpoints - End the season (top 10 saved) and reset all points
+• /reload_words - Reload word list
+• /blitz - Start a timed multi-word round
+
+Good luck! 🎯
+"""
+
+# Reply templates. Plain f-string functions are compiled to bytecode once at
+# import; bench_messages.py compares them with inline f-strings and with
+# str.format templates.
+
+def round_message(scrambled):
+    return (
+        f"🎯 Unscramble this word: {scrambled} \n\n"
+        " Use /hint and it will be penalty for all \n\n"
+        " Join now click /joinscramble"
+    )
+
+
+def hint_message(username, hint_number, max_hints, hint, revealed, total, point_message):
+    return (
+        f"👤 {username} used hint {hint_number}/{max_hints}\n"
+        f"📝 Hint: {hint}\n"
+        f"📊 Progress: {revealed}/{total} letters revealed\n"
+        f"{point_message}\n"
+        "⚠️ Warning: If max hints are used, all players will be penalized!"
+    )
+
+
+def attack_message(blocker, target, remaining):
+    return (
+        "⚡ POWER ATTACK ACTIVATED! ⚡\n"
+        f"🗡️ {blocker} attacked {target}\n"
+        f"❌ {target} cannot earn points this round!\n"
+        f"💰 Cost: -3 points ({remaining} points remaining)\n"
+        f"📢 {blocker} has used their attack power!"
+    )
+
+
+def correct_message(joined, username, earned, word, definition):
+    return (
+        f"{joined}🎉 Correct! {username} earned {earned} points!\n"
+        f"The word was: {word}"
+        f"{definition}"
+        "\n\nJoin now click /joinscramble\n"
+        "Next word in 40 seconds..."
+    )
+
+
+def blocked_message(joined, word):
+    return (
+        f"{joined}🎯 Correct! But you were blocked this round!\n"
+        f"The word was: {word}\n"
+        "❌ No points earned due to power block!"
+    )
+
+
+FINAL_FOOTER = "\n🌟 Thanks for playing! 🌟\nSee you in the next game! 👋"
+STOP_FOOTER = "\nThanks for playing! 🎉"
+
+MEDALS = {1: "🥇", 2: "🥈", 3: "🥉"}
+
+
+# Rendered boards are cached on their content, so every chat asking for the
+# same standings reuses one string instead of rebuilding it.
+
+@lru_cache(maxsize=128)
+def render_leaderboard(title, rows):
+    """Ranked list for ``rows``, a tuple of (username, score) pairs"""
+    leaderboard = f"🏆 {title} 🏆\n\n"
+    for i, (username, score) in enumerate(rows, 1):
+        leaderboard += f"{i}. {username}: {score} points\n"
+    return leaderboard
+
+
+@lru_cache(maxsize=32)
+def render_final_results(rows, footer=FINAL_FOOTER):
+    """Game-over results with medals for ``rows``, a tuple of (username, score)"""
+    winners_msg = "🎮 Game Over! Final Results 🏁\n\n🏆 Top Players 🏆\n\n"
+    for i, (username, score) in enumerate(rows, 1):
+        winners_msg += f"{MEDALS.get(i, '👏')} {i}. {username}: {score} points\n"
+    return winners_msg + footer
+
+
+def render_blitz_board(scrambled_words, duration, word_points, bonus):
+    """The blitz announcement for a tuple of scrambled words"""
+    lines = [f"⚡ BLITZ ROUND! ⚡\nUnscramble as many as you can in {duration} seconds!\n\n"]
+    lines.extend(f"{i}. {scrambled.upper()}\n" for i, scrambled in enumerate(scrambled_words, 1))
+    lines.append(
+        f"\n🎁 +{word_points} point per word, +{bonus} bonus for solving it first\n"
+        "Results are announced when time is up!"
+    )
+    return "".join(lines)
@@ -0,0 +1,90 @@
+import os
+import json
+import asyncio
+from datetime import datetime
+
+
+class PlayerRegistry:
+    """Registered players held in memory, with users.json written in batches.
+
+    New registrations are visible immediately but only reach disk when
+    ``batch_size`` of them are pending or ``flush_delay`` seconds after the
+    first unsaved one, so a burst of /joinscramble calls costs one write.
+    Call ``flush()`` on shutdown to persist anything still pending.
+    """
+
+    def __init__(self, path, batch_size=50, flush_delay=2.0):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_delay = flush_delay
+        self.users = self._read()
+        self._by_username = {}
+        for user_id, data in self.users.items():
+            self._index(user_id, data)
+        self._pending = 0
+        self._flush_handle = None
+
+    def _read(self):
+        try:
+            if os.path.exists(self.path) and os.path.getsize(self.path) > 0:
+                with open(self.path, 'r') as f:
+                    return json.load(f)
+        except json.JSONDecodeError:
+            print(f"Error reading players: {self.path} is corrupted, starting empty")
+        return {}
+
+    def _index(self, user_id, data):
+        # Keep the first player registered under a name, like the old linear scan
+        self._by_username.setdefault(data.get('username', '').lower(), user_id)
+
+    def __contains__(self, user_id):
+        return user_id in self.users
+
+    def __len__(self):
+        return len(self.users)
+
+    def username(self, user_id):
+        return self.users.get(user_id, {}).get('username', 'Anonymous')
+
+    def find_by_username(self, username):
+        """Return the user id registered under ``username`` (case-insensitive)"""
+        return self._by_username.get(username.lower())
+
+    def register(self, user_id, username):
+        """Add a player; returns False if they were already registered"""
+        if user_id in self.users:
+            return False
+        data = {
+            'username': username or "Anonymous",
+            'join_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+        self.users[user_id] = data
+        self._index(user_id, data)
+        self._pending += 1
+
+        if self._pending >= self.batch_size:
+            self.flush()
+        elif self._flush_handle is None:
+            try:
+                loop = asyncio.get_running_loop()
+                self._flush_handle = loop.call_later(self.flush_delay, self.flush)
+            except RuntimeError:
+                # No event loop (e.g. scripts): write straight away
+                self.flush()
+        return True
+
+    def flush(self):
+        """Write all pending registrations to disk in one go"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+        try:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(self.users, f)
+            os.replace(tmp_path, self.path)
+            self._pending = 0
+        except Exception as e:
+            print(f"Error saving players: {str(e)}")
@@ -0,0 +1,157 @@
+import os
+import csv
+import glob
+import argparse
+from datetime import datetime
+
+# Column order of the round log. Only ever append new columns at the end so
+# older rotated files stay readable with the same header logic.
+ROUND_COLUMNS = [
+    "ended_at",
+    "chat_id",
+    "word",
+    "word_length",
+    "outcome",
+    "solver_id",
+    "solve_seconds",
+    "solver_hints",
+    "total_hints",
+    "blocked_players",
+]
+
+ACTIVE_LOG_NAME = "rounds.csv"
+
+
+class RoundLog:
+    """Append-only CSV log of played rounds, rotated by size.
+
+    Every file carries the same header, so the whole directory can be read in
+    one batch, e.g. ``pandas.concat(map(pandas.read_csv, round_log_files(dir)))``.
+    """
+
+    def __init__(self, log_dir, max_bytes=5 * 1024 * 1024):
+        self.log_dir = log_dir
+        self.max_bytes = max_bytes
+        self.path = os.path.join(log_dir, ACTIVE_LOG_NAME)
+        os.makedirs(log_dir, exist_ok=True)
+
+    def rotate(self):
+        """Move the active log aside so the next append starts a new file"""
+        stamp = datetime.now().strftime("%Y%m%d%H%M%S%f")
+        os.replace(self.path, os.path.join(self.log_dir, f"rounds-{stamp}.csv"))
+
+    def append(self, record):
+        """Append one round record (a dict keyed by ROUND_COLUMNS)"""
+        try:
+            if os.path.exists(self.path) and os.path.getsize(self.path) >= self.max_bytes:
+                self.rotate()
+            write_header = not os.path.exists(self.path)
+            with open(self.path, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                if write_header:
+                    writer.writerow(ROUND_COLUMNS)
+                writer.writerow([record.get(column, "") for column in ROUND_COLUMNS])
+        except Exception as e:
+            print(f"Error writing round log: {str(e)}")
+
+
+def round_log_files(log_dir):
+    """Return all round log files in chronological order (rotated first)"""
+    rotated = sorted(glob.glob(os.path.join(log_dir, "rounds-*.csv")))
+    active = os.path.join(log_dir, ACTIVE_LOG_NAME)
+    return rotated + ([active] if os.path.exists(active) else [])
+
+
+def read_rounds(log_dir):
+    """Read every logged round as a dict of column lists"""
+    columns = {column: [] for column in ROUND_COLUMNS}
+    for path in round_log_files(log_dir):
+        with open(path, 'r', newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                for column in ROUND_COLUMNS:
+                    columns[column].append(row.get(column) or "")
+    return columns
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, int(round(fraction * (len(values) - 1)))))
+    return values[index]
+
+
+def summarize(columns):
+    """Build per-word and per-player statistics from read_rounds() output"""
+    words = {}
+    players = {}
+
+    def player(user_id):
+        return players.setdefault(user_id, {'solves': 0, 'times': [], 'hints': 0, 'blocked': 0})
+
+    for i, word in enumerate(columns["word"]):
+        outcome = columns["outcome"][i]
+        solver_id = columns["solver_id"][i]
+        stats = words.setdefault(word, {'rounds': 0, 'solved': 0, 'times': []})
+        stats['rounds'] += 1
+
+        if outcome == "solved" and solver_id:
+            seconds = float(columns["solve_seconds"][i] or 0)
+            stats['solved'] += 1
+            stats['times'].append(seconds)
+            solver = player(solver_id)
+            solver['solves'] += 1
+            solver['times'].append(seconds)
+            solver['hints'] += int(columns["solver_hints"][i] or 0)
+
+        for blocked_id in filter(None, columns["blocked_players"][i].split(";")):
+            player(blocked_id)['blocked'] += 1
+
+    for stats in list(words.values()) + list(players.values()):
+        stats['times'].sort()
+    return words, players
+
+
+def print_report(words, players, top=20):
+    print(f"📚 Words ({len(words)} total, hardest first)")
+    print(f"{'word':<16}{'rounds':>7}{'solved':>7}{'p50 s':>8}{'p90 s':>8}{'max s':>8}")
+    ranked_words = sorted(words.items(), key=lambda x: percentile(x[1]['times'], 0.5), reverse=True)
+    for word, stats in ranked_words[:top]:
+        times = stats['times']
+        print(
+            f"{word:<16}{stats['rounds']:>7}{stats['solved']:>7}"
+            f"{percentile(times, 0.5):>8.1f}{percentile(times, 0.9):>8.1f}"
+            f"{(times[-1] if times else 0.0):>8.1f}"
+        )
+
+    print()
+    print(f"👤 Players ({len(players)} total, most solves first)")
+    print(f"{'user_id':<16}{'solves':>7}{'p50 s':>8}{'hints':>7}{'blocked':>8}")
+    ranked_players = sorted(players.items(), key=lambda x: x[1]['solves'], reverse=True)
+    for user_id, stats in ranked_players[:top]:
+        print(
+            f"{user_id:<16}{stats['solves']:>7}{percentile(stats['times'], 0.5):>8.1f}"
+            f"{stats['hints']:>7}{stats['blocked']:>8}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline analytics for the word scramble round log")
+    parser.add_argument(
+        "--dir",
+        default=os.path.join(os.getcwd(), "PyData", "rounds"),
+        help="directory holding rounds*.csv files (default: ./PyData/rounds)"
+    )
+    parser.add_argument("--top", type=int, default=20, help="rows to show per table")
+    args = parser.parse_args()
+
+    if not round_log_files(args.dir):
+        print(f"No round logs found in {args.dir}")
+        return
+
+    words, players = summarize(read_rounds(args.dir))
+    print_report(words, players, top=args.top)
+
+
+if __name__ == "__main__":
+    main()
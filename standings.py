@@ -0,0 +1,158 @@
+import os
+import json
+import bisect
+from datetime import datetime
+
+BOARD_NAMES = ("week", "season", "all")
+
+# Finished weeks whose top players are kept (about a year)
+WEEKLY_SNAPSHOT_LIMIT = 52
+
+
+def week_key(now=None):
+    """ISO year-week label used to roll the weekly board, e.g. 2024-W07"""
+    year, week, _ = (now or datetime.now()).isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+class Board:
+    """Player scores plus a rank-ordered index kept up to date per change.
+
+    Reading the top N is a slice of the index, so leaderboards never have to
+    sort the full score table on request.
+    """
+
+    def __init__(self, scores=None):
+        self.scores = {}
+        self.version = 0
+        self._order = []  # sorted (-score, user_id) pairs
+        for user_id, score in (scores or {}).items():
+            self.set(user_id, score)
+
+    def set(self, user_id, score):
+        old = self.scores.get(user_id)
+        if old == score:
+            return
+        if old is not None:
+            del self._order[bisect.bisect_left(self._order, (-old, user_id))]
+        self.scores[user_id] = score
+        bisect.insort(self._order, (-score, user_id))
+        self.version += 1
+
+    def add(self, user_id, delta):
+        if delta:
+            self.set(user_id, self.scores.get(user_id, 0) + delta)
+
+    def top(self, limit=10):
+        return [(user_id, -neg_score) for neg_score, user_id in self._order[:limit]]
+
+    def clear(self):
+        self.scores.clear()
+        self._order.clear()
+        self.version += 1
+
+    def __len__(self):
+        return len(self.scores)
+
+
+class Standings:
+    """Weekly, season and all-time boards persisted in one JSON file.
+
+    The season board mirrors the spendable balances in userpoints.json, so
+    every point change is applied to it as a delta. The weekly and all-time
+    boards only count points earned, never hint or attack costs. Ending a
+    week or a season stores a top-N snapshot before that board is cleared.
+    """
+
+    def __init__(self, path, initial_points=None, snapshot_size=10):
+        self.path = path
+        self.snapshot_size = snapshot_size
+        data = self._read()
+        if data is None:
+            # First run: seed season and all-time from existing points
+            data = {
+                'season': 1,
+                'season_started': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                'season_points': dict(initial_points or {}),
+                'all_time': dict(initial_points or {}),
+            }
+        self.season = data.get('season', 1)
+        self.season_started = data.get('season_started', "")
+        self.week = data.get('week', week_key())
+        self.snapshots = data.get('snapshots', [])
+        self.weekly_snapshots = data.get('weekly_snapshots', [])
+        self.boards = {
+            'week': Board(data.get('weekly', {})),
+            'season': Board(data.get('season_points', {})),
+            'all': Board(data.get('all_time', {})),
+        }
+
+    def _read(self):
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r') as f:
+                    return json.load(f)
+        except json.JSONDecodeError:
+            print(f"Error reading standings: {self.path} is corrupted, starting fresh")
+        return None
+
+    def _roll_week(self):
+        current = week_key()
+        if current == self.week:
+            return
+        if len(self.boards['week']):
+            self.weekly_snapshots.append({
+                'week': self.week,
+                'top': [[user_id, score] for user_id, score in self.boards['week'].top(self.snapshot_size)],
+            })
+            del self.weekly_snapshots[:-WEEKLY_SNAPSHOT_LIMIT]
+        self.week = current
+        self.boards['week'].clear()
+        self.save()
+
+    def board(self, name):
+        """Return the 'week', 'season' or 'all' board"""
+        self._roll_week()
+        return self.boards[name]
+
+    def record(self, user_id, delta):
+        """Apply a point change to the boards (call save() to persist)"""
+        if not delta:
+            return
+        self._roll_week()
+        self.boards['season'].add(user_id, delta)
+        if delta > 0:
+            self.boards['week'].add(user_id, delta)
+            self.boards['all'].add(user_id, delta)
+
+    def end_season(self):
+        """Snapshot the season's top players, then start the next season"""
+        snapshot = {
+            'season': self.season,
+            'started': self.season_started,
+            'ended': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'top': [[user_id, score] for user_id, score in self.boards['season'].top(self.snapshot_size)],
+        }
+        self.snapshots.append(snapshot)
+        self.season += 1
+        self.season_started = snapshot['ended']
+        self.boards['season'].clear()
+        self.save()
+        return snapshot
+
+    def save(self):
+        try:
+            data = {
+                'season': self.season,
+                'season_started': self.season_started,
+                'week': self.week,
+                'weekly': self.boards['week'].scores,
+                'season_points': self.boards['season'].scores,
+                'all_time': self.boards['all'].scores,
+                'snapshots': self.snapshots,
+                'weekly_snapshots': self.weekly_snapshots,
+            }
+            with open(self.path, 'w') as f:
+                json.dump(data, f, separators=(',', ':'))
+        except Exception as e:
+            print(f"Error saving standings: {str(e)}")
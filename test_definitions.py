@@ -0,0 +1,101 @@
+"""Checks for DefinitionService against a local fake model.
+
+Run with ``python -m pytest test_definitions.py`` or ``python test_definitions.py``.
+Needs only the standard library (no Gemini key or network).
+"""
+import asyncio
+import types
+
+from definitions import DefinitionService, FALLBACK_DEFINITION
+
+
+class FakeModel:
+    """Stands in for genai.GenerativeModel and records how it was called"""
+
+    def __init__(self, delay=0.05, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+
+    async def generate_content_async(self, prompt):
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail:
+                raise RuntimeError("quota exceeded")
+            word = prompt.split('"')[1]
+            return types.SimpleNamespace(text=f"Definition: meaning of {word}")
+        finally:
+            self.active -= 1
+
+
+def test_same_word_shares_one_request():
+    async def run():
+        model = FakeModel()
+        service = DefinitionService(model)
+        results = await asyncio.gather(*[service.define("kilig") for _ in range(5)])
+        return model, results
+
+    model, results = asyncio.run(run())
+    assert model.calls == 1
+    assert results == ["📚 meaning of kilig"] * 5
+
+
+def test_concurrency_is_capped():
+    async def run():
+        model = FakeModel()
+        service = DefinitionService(model, max_concurrency=2)
+        await asyncio.gather(*[service.define(word) for word in ["a", "b", "c", "d", "e"]])
+        return model
+
+    model = asyncio.run(run())
+    assert model.calls == 5
+    assert model.peak == 2
+
+
+def test_timeout_returns_fallback():
+    async def run():
+        service = DefinitionService(FakeModel(delay=1), timeout=0.05)
+        return await service.define("hugot")
+
+    assert asyncio.run(run()) == FALLBACK_DEFINITION
+
+
+def test_circuit_opens_and_closes():
+    async def run():
+        model = FakeModel(delay=0, fail=True)
+        service = DefinitionService(model, failure_threshold=2, cooldown=0.1)
+        await service.define("a")
+        await service.define("b")
+        assert service.circuit_open
+
+        # While open the model is not called at all
+        assert await service.define("c") == FALLBACK_DEFINITION
+        assert model.calls == 2
+
+        # After the cooldown one good answer closes the circuit again
+        await asyncio.sleep(0.15)
+        model.fail = False
+        assert await service.define("d") == "📚 meaning of d"
+        assert not service.circuit_open
+
+    asyncio.run(run())
+
+
+def test_blocking_model_is_supported():
+    class BlockingModel:
+        def generate_content(self, prompt):
+            return types.SimpleNamespace(text="ok")
+
+    assert asyncio.run(DefinitionService(BlockingModel()).define("sawi")) == "📚 ok"
+
+
+if __name__ == "__main__":
+    for name, check in list(globals().items()):
+        if name.startswith("test_"):
+            check()
+            print(f"ok  {name}")
@@ -9,6 +9,13 @@ from pathlib import Path
 from dotenv import load_dotenv
 from telegram.ext import Application, CommandHandler, ContextTypes, MessageHandler, filters
 from datetime import datetime, timedelta
+from checkpoint import Checkpointer
+from roundlog import RoundLog
+from standings import Standings, BOARD_NAMES
+from definitions import DefinitionService
+from registry import PlayerRegistry
+from blitz import BlitzRound, WORD_POINTS, FIRST_SOLVER_BONUS
+import messages
 
 # Get the directory containing the script
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -47,6 +54,13 @@ except Exception as e:
     print(f"Error configuring Gemini AI: {str(e)}")
     sys.exit(1)
 
+# Shared definition lookups: bounded concurrency, timeouts and a circuit breaker
+definitions = DefinitionService(
+    model,
+    max_concurrency=int(os.getenv('GEMINI_MAX_CONCURRENCY', 4)),
+    timeout=float(os.getenv('GEMINI_TIMEOUT', 10)),
+)
+
 # Initialize bot with your token
 TOKEN = os.getenv('TELEGRAM_BOT_TOKEN')
 if not TOKEN or TOKEN == "your_telegram_token_here":
@@ -66,6 +80,15 @@ os.makedirs(DATA_DIR, exist_ok=True)
 WORDLIST_PATH = os.path.join(DATA_DIR, "wordlist.json")
 USERS_PATH = os.path.join(DATA_DIR, "users.json")
 POINTS_PATH = os.path.join(DATA_DIR, "userpoints.json")
+ROUNDS_DIR = os.path.join(DATA_DIR, "rounds")
+STANDINGS_PATH = os.path.join(DATA_DIR, "standings.json")
+CHECKPOINT_PATH = os.path.join(DATA_DIR, "game_state.ckpt")
+
+# Append-only history of played rounds (see roundlog.py for offline analytics)
+round_log = RoundLog(ROUNDS_DIR)
+
+# Register unknown players automatically on their first correct answer
+AUTO_JOIN = os.getenv('AUTO_JOIN', '0').lower() in ('1', 'true', 'yes')
 
 print("Environment setup completed successfully!")
 print(f"Using directories:")
@@ -82,42 +105,23 @@ class ScrambleGame:
         self.hints_used = {}
         self.next_game_time = None
         self.pinned_message_id = None
+        self.chat_id = None
+        self.round_started_at = None   # None once the current round is over
+        self.blitz = None              # BlitzRound while a blitz is running
+        self.next_round_task = None    # Pending timer that posts the next word
         self.words = self.load_words()
         self.used_words = set()
         self.word_reset_message = False
         self.revealed_positions = {}
-        # Block system attributes
-        self.blocks_available = set()  # Initialize empty set for blocks
+        # Block system attributes. Every registered player may attack once per
+        # game, so only the players who already did are tracked.
         self.blocked_players = set()   # Players blocked for current word
-        self.block_used = set()        # Players who have used their block this round
+        self.block_used = set()        # Players who have used their block this game
     
     async def get_word_definition(self, word):
-        """Get word definition using Gemini AI"""
-        try:
-          #  prompt = f'Give a short brief, tagalog definition with taglish funny hugot 1 qoute word "{word}".'
-            prompt = f'very short answer anung ibig sabihin ng "{word}" and taglish funny hugot bad jokes 1 qoute word "{word}".'
-            response = model.generate_content(prompt)
-            if response and response.text:
-                # Clean up the response to just get the definition
-                definition = response.text.strip()
-                if definition.startswith("Definition: "):
-                    definition = definition[11:]  # Remove "Definition: " prefix
-                return f"📚 {definition}"
-            return None
-        except Exception as e:
-            print(f"Error getting definition: {str(e)}")
-            return None
+        """Get word definition using Gemini AI (falls back to a stock line)"""
+        return await definitions.define(word)
         
-    async def initialize_blocks(self, chat_id):
-        """Initialize blocks for new game"""
-        try:
-            users = load_users()
-            self.blocks_available = set(users.keys())
-            self.blocked_players.clear()
-            self.block_used.clear()
-        except Exception as e:
-            print(f"Error initializing blocks: {str(e)}")
-
     def load_words(self):
         """Load words from wordlist.json"""
         try:
@@ -130,55 +134,132 @@ class ScrambleGame:
             return []
 
     def reset_game_blocks(self):
-        """Reset block system"""
-        self.blocks_available = set()  # Clear available blocks
-        self.blocked_players.clear()   # Clear blocked players
-        try:
-            users = load_users()
-            self.blocks_available.update(users.keys())  # Add all current players
-        except Exception as e:
-            print(f"Error resetting blocks: {str(e)}")
+        """Reset block system so every player has their attack again"""
+        self.blocked_players = set()
+        self.block_used = set()
+
+    def can_attack(self, user_id):
+        """Check if a player still has their attack for this game"""
+        return user_id not in self.block_used
 
     def scramble_word(self):
 
         """Reset only blocked_players for new word, keep block availability"""
         self.blocked_players.clear()
-        # Rest of scramble_word code stays the same...
-        """Select and scramble a word that hasn't been used"""
+        word = self.pick_word()
+        self.current_word = word
+        self.scrambled_word = self.shuffle_letters(word)
+        self.hints_used = {}
+        self.round_started_at = datetime.now()
+        if hasattr(self, 'revealed_positions'):
+            self.revealed_positions = {}  # Reset revealed positions for hints
+        return self.scrambled_word
+
+    def pick_word(self, exclude=()):
+        """Select a word that hasn't been used (and isn't in ``exclude``)"""
         if not self.words:
             raise ValueError("No words available")
                 
         # If all words have been used or available_words would be empty, reset
         if len(self.used_words) >= len(self.words):
-            self.used_words.clear()
+            self.used_words = set(exclude)
             self.word_reset_message = True
                 
         # Get available words (words that haven't been used)
-        available_words = [word for word in self.words if word not in self.used_words]
+        available_words = [word for word in self.words if word not in self.used_words and word not in exclude]
         
         if not available_words:  # Double check after filtering
-            self.used_words.clear()
-            available_words = self.words.copy()  # Use all words after reset
+            self.used_words = set(exclude)
+            available_words = [word for word in self.words if word not in exclude]  # Use all words after reset
                 
         # Select a random word from available words
         word = random.choice(available_words)
         self.used_words.add(word)  # Mark word as used
-            
-        # Scramble the word
+        return word
+
+    @staticmethod
+    def shuffle_letters(word):
+        """Scramble a word so it never comes out unchanged"""
         scrambled = list(word)
         while ''.join(scrambled) == word:
             random.shuffle(scrambled)
-                
-        self.current_word = word
-        self.scrambled_word = ''.join(scrambled)
-        self.hints_used = {}
-        if hasattr(self, 'revealed_positions'):
-            self.revealed_positions = {}  # Reset revealed positions for hints
-        return self.scrambled_word
+        return ''.join(scrambled)
+
+    def draw_words(self, count):
+        """Pick up to ``count`` distinct unused words as (word, scrambled) pairs"""
+        if not self.words:
+            raise ValueError("No words available")
+        pairs = []
+        picked = set()
+        for _ in range(min(count, len(set(self.words)))):
+            # Words already in this batch stay excluded if the list wraps around
+            word = self.pick_word(exclude=picked)
+            picked.add(word)
+            pairs.append((word, self.shuffle_letters(word)))
+        return pairs
     
         
     
 
+    def finish_round(self, outcome, solver_id=None):
+        """Close the current round and append it to the round log"""
+        if self.round_started_at is None:
+            return None
+        elapsed = (datetime.now() - self.round_started_at).total_seconds()
+        self.round_started_at = None
+        round_log.append({
+            'ended_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'chat_id': self.chat_id or "",
+            'word': self.current_word,
+            'word_length': len(self.current_word),
+            'outcome': outcome,
+            'solver_id': solver_id or "",
+            'solve_seconds': f"{elapsed:.2f}",
+            'solver_hints': self.hints_used.get(solver_id, 0) if solver_id else 0,
+            'total_hints': sum(self.hints_used.values()),
+            'blocked_players': ";".join(sorted(self.blocked_players)),
+        })
+        return elapsed
+
+    def to_state(self):
+        """Snapshot of the in-memory game for checkpoints (JSON-friendly)"""
+        return {
+            'game_active': self.game_active,
+            'chat_id': self.chat_id,
+            'current_word': self.current_word,
+            'scrambled_word': self.scrambled_word,
+            'used_words': sorted(self.used_words),
+            'word_reset_message': self.word_reset_message,
+            'hints_used': self.hints_used,
+            'revealed_positions': {uid: sorted(pos) for uid, pos in self.revealed_positions.items()},
+            'blocked_players': sorted(self.blocked_players),
+            'block_used': sorted(self.block_used),
+            'pinned_message_id': self.pinned_message_id,
+            'round_started_at': self.round_started_at.timestamp() if self.round_started_at else None,
+            'next_game_time': self.next_game_time.timestamp() if self.next_game_time else None,
+            'blitz': self.blitz.to_state() if self.blitz else None,
+        }
+
+    def restore(self, state):
+        """Load a checkpoint taken by to_state() into this game"""
+        self.game_active = state.get('game_active', False)
+        self.chat_id = state.get('chat_id')
+        self.current_word = state.get('current_word', "")
+        self.scrambled_word = state.get('scrambled_word', "")
+        # Words removed from the list since the checkpoint are dropped
+        self.used_words = set(state.get('used_words', [])) & set(self.words)
+        self.word_reset_message = state.get('word_reset_message', False)
+        self.hints_used = state.get('hints_used', {})
+        self.revealed_positions = {uid: set(pos) for uid, pos in state.get('revealed_positions', {}).items()}
+        self.blocked_players = set(state.get('blocked_players', []))
+        self.block_used = set(state.get('block_used', []))
+        self.pinned_message_id = state.get('pinned_message_id')
+        started = state.get('round_started_at')
+        self.round_started_at = datetime.fromtimestamp(started) if started else None
+        next_time = state.get('next_game_time')
+        self.next_game_time = datetime.fromtimestamp(next_time) if next_time else None
+        self.blitz = BlitzRound.from_state(state['blitz']) if state.get('blitz') else None
+
     def reload_words(self):
         """Reload words from wordlist.json"""
         self.words = self.load_words()
@@ -188,15 +269,16 @@ class ScrambleGame:
 # Initialize game state
 game = ScrambleGame()
 
-def load_users():
-    if os.path.exists(USERS_PATH):
-        with open(USERS_PATH, 'r') as f:
-            return json.load(f)
-    return {}
+# Periodic snapshots of the game so a restart resumes where it left off
+checkpoints = Checkpointer(CHECKPOINT_PATH, interval=float(os.getenv('CHECKPOINT_INTERVAL', 15)))
+background_tasks = set()
 
-def save_users(users):
-    with open(USERS_PATH, 'w') as f:
-        json.dump(users, f)
+# Registered players, kept in memory and written to users.json in batches
+players = PlayerRegistry(USERS_PATH)
+
+def load_users():
+    """Return registered players (served from memory, no disk read)"""
+    return players.users
 
 def load_points():
     try:
@@ -222,65 +304,24 @@ def save_points(points):
             json.dump(points, f, indent=2)
     except Exception as e:
         print(f"Error saving points: {str(e)}")
+        return
+    # Only persist leaderboards once the balances they mirror are on disk
+    standings.save()
+
+def leaderboard_rows(top_players):
+    """Turn (user_id, score) pairs into the hashable rows the renderers cache on"""
+    return tuple((players.username(user_id), score) for user_id, score in top_players)
+
+def set_points(points, user_id, value):
+    """Set a player's points and feed the change to the leaderboards"""
+    standings.record(user_id, value - points.get(user_id, 0))
+    points[user_id] = value
+
+# Weekly / season / all-time leaderboards, maintained incrementally
+standings = Standings(STANDINGS_PATH, initial_points=load_points())
 
 async def game_info(update: Update, context: ContextTypes.DEFAULT_TYPE):
-        game_info = """
-    🎮 WORD SCRAMBLE BATTLE 🎮
-
-    📜 Description:
-    A fun word guessing game where players compete to unscramble words while using strategy with hints and attacks! Battle your way to the top of the leaderboard!
-
-    🎯 Game Features:
-    • Random scrambled words (4-15 letters)
-    • Automatic new words every 60 seconds
-    • Points system with leaderboard
-    • Hint system with strategy
-    • Attack power to block opponents
-    • Tagalog definition and hugot quotes
-    • Continuous gameplay until stopped
-
-    📋 Basic Rules:
-    1. Join game: /joinscramble
-    2. Guess the scrambled word by typing it
-    3. First correct answer gets points (1-3 points)
-    4. New word appears every 60 seconds
-    5. Check rankings: /leaderboard
-
-    💡 Hint System:
-    • Use /hint to reveal letters
-    • Max hints depends on word length
-    • Each hint costs 1 point
-    • Progressive reveals (more letters shown with each hint)
-    • Players with 0 points limited to 3 hints
-    • Points deducted increase with each hint used
-
-    ⚔️ Attack Power:
-    • Use /attack username to block opponent
-    • Costs 3 points to use attack
-    • Can only use once per game session
-    • Blocked player gets no points for correct answer
-    • Attack power resets when new game starts
-
-    🎁 Scoring System:
-    • Correct answer: +1 to 3 points
-    • Using hint: -1 point (increases with each hint)
-    • Using attack: -3 points
-    • Getting blocked: 0 points for correct answer
-
-    👑 Admin Commands:
-    • /start_game - Start new game
-    • /stop_game - End game and show winners
-    • /resetpoints - Reset all scores
-    • /reload_words - Reload word list
-
-    💭 Winner Rewards:
-    • Top players shown on leaderboard
-    • Special medals for top 3 players (🥇🥈🥉)
-    • Bragging rights until next game!
-
-    Type /startscramblewords to begin! Good luck! 🎯
-    """
-        await update.message.reply_text(game_info)
+    await update.message.reply_text(messages.GAME_INFO)
 
 async def reload_words(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Admin command to reload words from wordlist.json"""
@@ -295,7 +336,7 @@ async def reload_words(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text(f"Error reloading word list: {str(e)}")
 
 async def reset_points(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """Admin command to reset all points"""
+    """Admin command to end the season and reset all points"""
     if not await is_admin(update, context):
         await update.message.reply_text("❌ Only admins can reset points!")
         return
@@ -304,11 +345,15 @@ async def reset_points(update: Update, context: ContextTypes.DEFAULT_TYPE):
         # Reset points to empty dictionary
         with open(POINTS_PATH, 'w') as f:
             json.dump({}, f)
+
+        # Only close the season (saving its top players) once the wipe worked
+        snapshot = standings.end_season()
         
         await update.message.reply_text(
             "🔄 Points Reset Successfully!\n"
+            f"🏁 Season {snapshot['season']} has ended, top {len(snapshot['top'])} saved (see /seasons)\n"
             "📊 All player scores have been reset to 0\n"
-            "💫 New game, fresh start!"
+            f"💫 Season {standings.season} starts now, fresh start!"
         )
     except Exception as e:
         await update.message.reply_text(f"❌ Error resetting points: {str(e)}")
@@ -316,39 +361,15 @@ async def reset_points(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def show_final_leaderboard(context: ContextTypes.DEFAULT_TYPE, chat_id: int):
     """Show final leaderboard and thank you message"""
-    points = load_points()
-    if not points:
+    top_players = standings.board("season").top(10)
+    if not top_players:
         await context.bot.send_message(
             chat_id=chat_id,
             text="🎮 Game Over!\n\nNo scores recorded in this session. Thanks for playing! 🎉"
         )
         return
         
-    sorted_points = sorted(points.items(), key=lambda x: x[1], reverse=True)
-    users = load_users()
-    
-    # Create winners message
-    winners_msg = "🎮 Game Over! Final Results 🏁\n\n"
-    winners_msg += "🏆 Top Players 🏆\n\n"
-    
-    for i, (user_id, score) in enumerate(sorted_points[:10], 1):
-        username = users.get(user_id, {}).get('username', 'Anonymous')
-        
-        # Add medal emoji for top 3
-        if i == 1:
-            medal = "🥇"
-        elif i == 2:
-            medal = "🥈"
-        elif i == 3:
-            medal = "🥉"
-        else:
-            medal = "👏"
-            
-        winners_msg += f"{medal} {i}. {username}: {score} points\n"
-    
-    winners_msg += "\n🌟 Thanks for playing! 🌟\n"
-    winners_msg += "See you in the next game! 👋"
-    
+    winners_msg = messages.render_final_results(leaderboard_rows(top_players))
     await context.bot.send_message(chat_id=chat_id, text=winners_msg)
 
 # Modify the start_scramble function to include the new command
@@ -357,25 +378,7 @@ async def start_scramble(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text("Only admins can start the game!")
         return
 
-    rules = """
-🎮 Welcome to Scramble Words! 🎮
-
-Rules:
-1. Words are 4-15 letters long
-2. Type /joinscramble to register
-3. Use /hint for help (max 3 hints, -1 point penalty)
-4. Check scores with /leaderboard
-5. Game continues automatically every 60 seconds
-
-Admin Commands:
-• /start_game - Start new game
-• /stop_game - Stop game
-• /resetpoints - Reset all points
-• /reload_words - Reload word list
-
-Good luck! 🎯
-    """
-    await update.message.reply_text(rules)
+    await update.message.reply_text(messages.RULES)
 
 async def is_admin(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user = await context.bot.get_chat_member(update.effective_chat.id, update.effective_user.id)
@@ -385,18 +388,9 @@ async def join_scramble(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not update.message:
         return
         
-    users = load_users()
     user_id = str(update.effective_user.id)
     
-    if user_id not in users:
-        users[user_id] = {
-            'username': update.effective_user.username or "Anonymous",
-            'join_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        }
-        save_users(users)
-        # Add new player to blocks_available if game is active
-        if game.game_active:
-            game.blocks_available.add(user_id)
+    if players.register(user_id, update.effective_user.username):
         try:
             await update.message.reply_text(
                 "Welcome to Scramble Words! 🎮\n"
@@ -409,7 +403,7 @@ async def join_scramble(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 "You can use /attack username to block a player from earning points! ⚡"
             )
     else:
-        can_block = user_id in game.blocks_available
+        can_block = game.can_attack(user_id)
         try:
             await update.message.reply_text(
                 "You're already registered! 📝\n" +
@@ -428,16 +422,22 @@ async def start_game(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not await is_admin(update, context):
         await update.message.reply_text("Only admins can start the game!")
         return
+
+    if game.blitz:
+        await update.message.reply_text("❌ Wait for the blitz round to finish first!")
+        return
     
     game.game_active = True
+    game.chat_id = update.effective_chat.id
+    cancel_next_round()
     
-    # Reset and initialize blocks
-    game.reset_game_blocks()  # Reset blocks first
-    await game.initialize_blocks(update.effective_chat.id)  # Then initialize for new game
+    # Give every player their attack back
+    game.reset_game_blocks()
     
     await new_round(context, update.effective_chat.id)
 
 async def new_round(context: ContextTypes.DEFAULT_TYPE, chat_id: int):
+    cancel_next_round()
     if not game.game_active:
         return
         
@@ -450,6 +450,9 @@ async def new_round(context: ContextTypes.DEFAULT_TYPE, chat_id: int):
             )
             game.word_reset_message = False
         
+        # Log a round that is being replaced without a winner
+        game.finish_round("skipped")
+
         try:
             scrambled = game.scramble_word()
         except ValueError:
@@ -462,7 +465,7 @@ async def new_round(context: ContextTypes.DEFAULT_TYPE, chat_id: int):
             game.game_active = False
             return
             
-        message = f"🎯 Unscramble this word: {scrambled.upper()} \n\n Use /hint and it will be penalty for all \n\n Join now click /joinscramble"
+        message = messages.round_message(scrambled=scrambled.upper())
         
         # Unpin previous message if exists
         if game.pinned_message_id:
@@ -496,11 +499,18 @@ async def stop_game(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
     
     try:
+        # A running blitz ends right away, scoring the answers so far
+        if game.blitz:
+            await end_blitz(context, game.blitz)
+            return
+
         if not game.game_active:
             await update.message.reply_text("No active game to stop!")
             return
             
         game.game_active = False
+        cancel_next_round()
+        game.finish_round("stopped")
         
         # Unpin the last scrambled word if exists
         if game.pinned_message_id:
@@ -513,38 +523,15 @@ async def stop_game(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 pass
         
         # Get and display winners
-        points = load_points()
-        if not points:
+        top_players = standings.board("season").top(10)
+        if not top_players:
             await update.message.reply_text(
                 "🎮 Game Over!\n\n"
                 "No scores recorded in this session."
             )
             return
             
-        sorted_points = sorted(points.items(), key=lambda x: x[1], reverse=True)
-        users = load_users()
-        
-        # Create winners message
-        winners_msg = "🎮 Game Over! Final Results 🏁\n\n"
-        winners_msg += "🏆 Top Players 🏆\n\n"
-        
-        for i, (user_id, score) in enumerate(sorted_points[:10], 1):
-            username = users.get(user_id, {}).get('username', 'Anonymous')
-            
-            # Add medal emoji for top 3
-            if i == 1:
-                medal = "🥇"
-            elif i == 2:
-                medal = "🥈"
-            elif i == 3:
-                medal = "🥉"
-            else:
-                medal = "👏"
-                
-            winners_msg += f"{medal} {i}. {username}: {score} points\n"
-        
-        winners_msg += "\nThanks for playing! 🎉"
-        
+        winners_msg = messages.render_final_results(leaderboard_rows(top_players), messages.STOP_FOOTER)
         await update.message.reply_text(winners_msg)
         
     except Exception as e:
@@ -555,6 +542,10 @@ async def hint(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not game.game_active:
         await update.message.reply_text("No active game! Wait for admin to start.")
         return
+
+    if game.round_started_at is None:
+        await update.message.reply_text("⏳ This word is already solved! Wait for the next word.")
+        return
         
     user_id = str(update.effective_user.id)
     users = load_users()
@@ -599,7 +590,7 @@ async def hint(update: Update, context: ContextTypes.DEFAULT_TYPE):
         for player_id in users.keys():
             if player_id in points and points[player_id] > 0:
                 original_points = points[player_id]
-                points[player_id] = max(0, points[player_id] - 2)  # -2 points penalty
+                set_points(points, player_id, max(0, points[player_id] - 2))  # -2 points penalty
                 penalty_updates.append(f"@{users[player_id]['username']}: {original_points} → {points[player_id]}")
         
         save_points(points)
@@ -625,7 +616,7 @@ async def hint(update: Update, context: ContextTypes.DEFAULT_TYPE):
     
     # Apply point penalty
     if user_id in points and points[user_id] > 0:
-        points[user_id] = max(0, points[user_id] - point_deduction)
+        set_points(points, user_id, max(0, points[user_id] - point_deduction))
         save_points(points)
         point_message = f"📉 -{point_deduction} points (now at {points[user_id]} points)"
     else:
@@ -655,12 +646,14 @@ async def hint(update: Update, context: ContextTypes.DEFAULT_TYPE):
     
     # Create announcement message
     revealed_count = len(game.revealed_positions[user_id])
-    announcement = (
-        f"👤 {username} used hint {game.hints_used[user_id]}/{max_hints}\n"
-        f"📝 Hint: {hint}\n"
-        f"📊 Progress: {revealed_count}/{total_letters} letters revealed\n"
-        f"{point_message}\n"
-        f"⚠️ Warning: If max hints are used, all players will be penalized!"
+    announcement = messages.hint_message(
+        username=username,
+        hint_number=game.hints_used[user_id],
+        max_hints=max_hints,
+        hint=hint,
+        revealed=revealed_count,
+        total=total_letters,
+        point_message=point_message,
     )
     
     await update.message.reply_text(announcement)
@@ -671,25 +664,57 @@ async def hint(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 
 async def status_scramble(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    points = load_points()
-    if not points:
+    """Show the weekly, season (default) or all-time leaderboard"""
+    board_name = context.args[0].lower() if context.args else "season"
+    if board_name not in BOARD_NAMES:
+        await update.message.reply_text("Usage: /leaderboard [week|season|all]")
+        return
+
+    top_players = standings.board(board_name).top(10)
+    if not top_players:
         await update.message.reply_text("No scores yet!")
         return
         
-    sorted_points = sorted(points.items(), key=lambda x: x[1], reverse=True)
-    users = load_users()
-    
-    leaderboard = "🏆 Leaderboard 🏆\n\n"
-    for i, (user_id, score) in enumerate(sorted_points[:10], 1):
-        username = users.get(user_id, {}).get('username', 'Anonymous')
-        leaderboard += f"{i}. {username}: {score} points\n"
+    titles = {
+        "week": f"Weekly Leaderboard ({standings.week})",
+        "season": f"Season {standings.season} Leaderboard",
+        "all": "All-Time Leaderboard",
+    }
     
+    leaderboard = messages.render_leaderboard(titles[board_name], leaderboard_rows(top_players))
     await update.message.reply_text(leaderboard)
 
+async def season_history(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Show the winners of last week and the most recent finished seasons"""
+    standings.board("week")  # Snapshot the previous week if it just ended
+    if not standings.snapshots and not standings.weekly_snapshots:
+        await update.message.reply_text(f"No finished seasons yet! Season {standings.season} is in progress.")
+        return
+
+    users = load_users()
+    history = "📜 Past Seasons 📜\n"
+    if standings.weekly_snapshots:
+        last_week = standings.weekly_snapshots[-1]
+        history += f"\n📅 Week {last_week['week']}\n"
+        for i, (user_id, score) in enumerate(last_week['top'][:3], 1):
+            username = users.get(user_id, {}).get('username', 'Anonymous')
+            history += f"{i}. {username}: {score} points\n"
+    for snapshot in reversed(standings.snapshots[-5:]):
+        history += f"\n🏁 Season {snapshot['season']} (ended {snapshot['ended'][:10]})\n"
+        for i, (user_id, score) in enumerate(snapshot['top'][:3], 1):
+            username = users.get(user_id, {}).get('username', 'Anonymous')
+            history += f"{i}. {username}: {score} points\n"
+
+    await update.message.reply_text(history)
+
 async def block_player(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not game.game_active:
         await update.message.reply_text("No active game! Wait for admin to start.")
         return
+
+    if game.round_started_at is None:
+        await update.message.reply_text("⏳ This word is already solved! Attack when the next word appears.")
+        return
         
     user_id = str(update.effective_user.id)
     users = load_users()
@@ -708,7 +733,7 @@ async def block_player(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return
     
-    if user_id not in game.blocks_available:
+    if not game.can_attack(user_id):
         await update.message.reply_text(
             "❌ You've already used your attack power in this game!\n"
             "Attack power resets when admin starts a new game with /start_game"
@@ -721,11 +746,7 @@ async def block_player(update: Update, context: ContextTypes.DEFAULT_TYPE):
     
     target_username = context.args[0].replace("@", "")
     
-    target_id = None
-    for uid, data in users.items():
-        if data['username'].lower() == target_username.lower():
-            target_id = uid
-            break
+    target_id = players.find_by_username(target_username)
     
     if not target_id:
         await update.message.reply_text(f"Player @{target_username} not found!")
@@ -736,85 +757,245 @@ async def block_player(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
     
     # Deduct points and apply attack
-    points[user_id] = current_points - 3
+    set_points(points, user_id, current_points - 3)
     save_points(points)
     game.blocked_players.add(target_id)
-    game.blocks_available.remove(user_id)
+    game.block_used.add(user_id)
     
     blocker_name = users[user_id]['username']
     target_name = users[target_id]['username']
     
-    announcement = (
-        f"⚡ POWER ATTACK ACTIVATED! ⚡\n"
-        f"🗡️ {blocker_name} attacked {target_name}\n"
-        f"❌ {target_name} cannot earn points this round!\n"
-        f"💰 Cost: -3 points ({points[user_id]} points remaining)\n"
-        f"📢 {blocker_name} has used their attack power!"
-    )
+    announcement = messages.attack_message(blocker=blocker_name, target=target_name, remaining=points[user_id])
     
     await context.bot.send_message(
         chat_id=update.effective_chat.id,
         text=announcement
     )
 
-async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    if not update.message or not game.game_active or not game.current_word:
+async def start_blitz(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Admin command: /blitz [words] [seconds] posts a batch of words at once"""
+    if not await is_admin(update, context):
+        await update.message.reply_text("Only admins can start a blitz!")
         return
-        
+
+    if game.game_active or game.blitz:
+        await update.message.reply_text("❌ Stop the current game before starting a blitz!")
+        return
+
+    try:
+        word_count = int(context.args[0]) if context.args else 10
+        duration = int(context.args[1]) if len(context.args or []) > 1 else 60
+    except ValueError:
+        await update.message.reply_text("Usage: /blitz [words] [seconds]\nExample: /blitz 10 60")
+        return
+    word_count = max(1, min(word_count, 50))
+    duration = max(15, min(duration, 600))
+
+    try:
+        pairs = game.draw_words(word_count)
+    except ValueError:
+        await update.message.reply_text("🎯 Word list is empty!")
+        return
+
+    chat_id = update.effective_chat.id
+    blitz = BlitzRound(pairs, duration, chat_id)
+
+    message = messages.render_blitz_board(blitz.scrambled, duration, WORD_POINTS, FIRST_SOLVER_BONUS)
+    await context.bot.send_message(chat_id=chat_id, text=message)
+
+    # Only go live once the words were actually posted
+    game.blitz = blitz
+    # Run the timer in the background so guesses keep flowing in meanwhile;
+    # shutdown cancels it so the checkpoint keeps the blitz running
+    start_background(finish_blitz(context.application, blitz, duration))
+
+async def finish_blitz(application: Application, blitz: BlitzRound, delay: float):
+    """Wait out the blitz, then end it unless an admin already stopped it"""
+    await asyncio.sleep(delay)
+    if game.blitz is blitz:
+        await end_blitz(application, blitz)
+
+async def end_blitz(context: ContextTypes.DEFAULT_TYPE, blitz: BlitzRound):
+    """Score every blitz participant in one batched update and post results"""
+    game.blitz = None
+    chat_id = blitz.chat_id
+
+    scores = blitz.scores()
+    if scores:
+        points = load_points()
+        for user_id, earned in scores.items():
+            set_points(points, user_id, points.get(user_id, 0) + earned)
+        save_points(points)
+
+    ended_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    for word in blitz.words:
+        solvers = blitz.solvers.get(word, [])
+        round_log.append({
+            'ended_at': ended_at,
+            'chat_id': chat_id,
+            'word': word,
+            'word_length': len(word),
+            'outcome': "solved" if solvers else "unsolved",
+            'solver_id': solvers[0] if solvers else "",
+            'solve_seconds': f"{blitz.solve_seconds[word]:.2f}" if solvers else "",
+        })
+
+    results = "⏰ BLITZ OVER! ⏰\n\n📝 Answers:\n"
+    for word in blitz.words:
+        solvers = blitz.solvers.get(word, [])
+        if not solvers:
+            results += f"• {word.upper()}: ❌ unsolved\n"
+            continue
+        others = f" (+{len(solvers) - 1} more)" if len(solvers) > 1 else ""
+        results += f"• {word.upper()}: 🥇 {players.username(solvers[0])}{others}\n"
+
+    results += "\n🏆 Blitz Scores 🏆\n"
+    if scores:
+        for i, (user_id, earned) in enumerate(scores.most_common(10), 1):
+            results += f"{i}. {players.username(user_id)}: +{earned} points\n"
+    else:
+        results += "Nobody scored this time! 😅\n"
+
+    await context.bot.send_message(chat_id=chat_id, text=results)
+
+def handle_blitz_guess(update: Update):
+    """Record a blitz guess; results are only sent when the blitz ends"""
     user_id = str(update.effective_user.id)
-    users = load_users()
-    if user_id not in users:
+    if user_id not in players:
+        if not AUTO_JOIN or not game.blitz.matches(update.message.text):
+            return
+        players.register(user_id, update.effective_user.username)
+    game.blitz.guess(user_id, update.message.text)
+
+async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    if game.blitz and update.message and update.message.text:
+        handle_blitz_guess(update)
+        return
+
+    if not update.message or not game.game_active or not game.current_word:
         return
         
     if not update.message.text:
         return
         
+    # Membership is an in-memory lookup, so chatter from non-players costs no I/O
+    user_id = str(update.effective_user.id)
+    joined_text = ""
+    if user_id not in players:
+        if not AUTO_JOIN:
+            return
+        if update.message.text.lower().strip() != game.current_word or game.round_started_at is None:
+            return
+        players.register(user_id, update.effective_user.username)
+        joined_text = "👋 Welcome! You've been auto-joined to Scramble Words.\n"
+    users = load_users()
+        
     guess = update.message.text.lower().strip()
     if guess == game.current_word:
+        # Only the first correct answer of a round counts
+        if game.round_started_at is None:
+            return
+
         points = load_points()
         if user_id not in points:
             points[user_id] = 0
             
         # Check if player is blocked
         if user_id in game.blocked_players:
+            game.finish_round("blocked", user_id)
             await update.message.reply_text(
-                f"🎯 Correct! But you were blocked this round!\n"
-                f"The word was: {game.current_word.upper()}\n"
-                f"❌ No points earned due to power block!"
+                messages.blocked_message(joined=joined_text, word=game.current_word.upper())
             )
         else:
             # Normal point calculation
             hint_penalty = game.hints_used.get(user_id, 0)
             earned_points = max(1, 3 - hint_penalty)
-            points[user_id] += earned_points
+            set_points(points, user_id, points[user_id] + earned_points)
             save_points(points)
+            game.finish_round("solved", user_id)
             
             # Get word definition
             definition = await game.get_word_definition(game.current_word)
             definition_text = f"\n{definition}" if definition else ""
             
             await update.message.reply_text(
-                f"🎉 Correct! {users[user_id]['username']} earned {earned_points} points!\n"
-                f"The word was: {game.current_word.upper()}"
-                f"{definition_text}"
-                f"\n\nJoin now click /joinscramble\n"
-                f"Next word in 40 seconds..."
+                messages.correct_message(
+                    joined=joined_text,
+                    username=users[user_id]['username'],
+                    earned=earned_points,
+                    word=game.current_word.upper(),
+                    definition=definition_text,
+                )
             )
         
-        # Schedule next round
-        await asyncio.sleep(60)
-        await new_round(context, update.effective_chat.id)
+        # Schedule next round in the background (recorded so a restart can pick it up)
+        game.next_game_time = datetime.now() + timedelta(seconds=60)
+        game.next_round_task = start_background(next_round_after(context.application, update.effective_chat.id, 60))
+
+async def next_round_after(application: Application, chat_id: int, delay: float):
+    """Resume the classic game's countdown to the next word"""
+    await asyncio.sleep(delay)
+    await new_round(application, chat_id)
+
+def start_background(coroutine):
+    """Run a coroutine alongside polling, keeping a reference until it ends"""
+    task = asyncio.create_task(coroutine)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return task
+
+def cancel_next_round():
+    """Drop a pending next-word timer so it can't replace a newer word"""
+    task = game.next_round_task
+    game.next_round_task = None
+    # new_round() runs inside the timer itself, which must not cancel itself
+    if task and task is not asyncio.current_task():
+        task.cancel()
+
+async def on_startup(application: Application):
+    """Restore the last checkpoint, resume any running round, start checkpointing"""
+    state = checkpoints.load()
+    if state:
+        game.restore(state)
+        if game.blitz:
+            print(f"Resuming blitz in chat {game.blitz.chat_id}")
+            start_background(finish_blitz(application, game.blitz, game.blitz.remaining()))
+        elif game.game_active and game.chat_id:
+            print(f"Resuming game in chat {game.chat_id}")
+            if game.round_started_at is None:
+                # The last word was already solved: wait out the rest of the pause
+                delay = (game.next_game_time - datetime.now()).total_seconds() if game.next_game_time else 0
+                game.next_round_task = start_background(next_round_after(application, game.chat_id, max(0, delay)))
+    start_background(checkpoints.run(game.to_state))
+
+async def on_shutdown(application: Application):
+    """Persist anything still buffered before the process exits"""
+    tasks = list(background_tasks)
+    for task in tasks:
+        task.cancel()
+    # Let the cancellations finish before the event loop is closed
+    await asyncio.gather(*tasks, return_exceptions=True)
+    players.flush()
+    checkpoints.save(game.to_state())
 
 def main():
-    application = Application.builder().token(TOKEN).build()
+    application = (
+        Application.builder()
+        .token(TOKEN)
+        .post_init(on_startup)
+        .post_shutdown(on_shutdown)
+        .build()
+    )
     
     # Add handlers
     application.add_handler(CommandHandler("startscramblewords", start_scramble))
     application.add_handler(CommandHandler("start_game", start_game))
+    application.add_handler(CommandHandler("blitz", start_blitz))
     application.add_handler(CommandHandler("stop_game", stop_game))  # New stop game handler
     application.add_handler(CommandHandler("joinscramble", join_scramble))
     application.add_handler(CommandHandler("hint", hint))
     application.add_handler(CommandHandler("leaderboard", status_scramble))
+    application.add_handler(CommandHandler("seasons", season_history))
     application.add_handler(CommandHandler("reload_words", reload_words))
     application.add_handler(CommandHandler("resetpoints", reset_points))
     application.add_handler(CommandHandler("attack", block_player))